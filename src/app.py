@@ -12,8 +12,14 @@ from textual.widgets import (
 from textual.screen import Screen
 from textual.containers import Horizontal, Vertical, Grid
 from textual.events import Key
+from textual.worker import Worker
+from textual.widgets.directory_tree import DirEntry
+from textual.widgets.tree import TreeNode
+from textual.await_complete import AwaitComplete
 
 from pathlib import Path
+from functools import lru_cache
+from typing import Iterator
 import os.path
 import sys
 
@@ -21,6 +27,24 @@ import sys
 from .notebook import Notebook
 from .save_as_screen import SaveAsScreen
 
+DIRECTORY_CACHE_SIZE = 512  # number of directory listings kept by `scan_directory`
+
+
+@lru_cache(maxsize=DIRECTORY_CACHE_SIZE)
+def scan_directory(location: str, mtime_ns: int) -> tuple[Path, ...]:
+    """List a directory with `os.scandir`. Cached by the modification time of the directory so
+    going back to a directory that has not changed does not list it again.
+
+    Args:
+        location: the directory to list.
+        mtime_ns: the modification time of the directory, changes when entries are added,
+            removed or renamed.
+
+    Returns: the path of each entry.
+    """
+    with os.scandir(location) as entries:
+        return tuple(Path(entry.path) for entry in entries)
+
 
 class QuitScreen(Screen):
     """Screen with a dialog to quit."""
@@ -70,11 +94,59 @@ class DirectoryNav(DirectoryTree):
         ("backspace", "back_dir", "Go up a directory"),
     ]
     selected_dir: str | None = None  # keep track of the selected directory
+    _navigating: bool = False  # whether the next reload comes from moving to another directory
+
+    def navigate(self, path: Path) -> None:
+        """Move the tree to another directory. The reload this causes can use the cached listings.
+
+        Args:
+            path: the absolute, normalized directory to move to.
+        """
+        if path != Path(self.path):
+            self._navigating = True
+            self.path = path
+
+    def reload_node(self, node: TreeNode[DirEntry]) -> AwaitComplete:
+        """Reload the content of a node. Reloads other than the ones from `navigate` list the
+        directories again even if their modification time did not change (coarse filesystem
+        timestamps).
+
+        Args:
+            node: the node to reload.
+
+        Returns: an optionally awaitable that ensures the node has finished reloading.
+        """
+        if self._navigating:
+            self._navigating = False
+        else:
+            scan_directory.cache_clear()
+        return super().reload_node(node)
+
+    def _directory_content(self, location: Path, worker: Worker) -> Iterator[Path]:
+        """Load the content of a directory with `scan_directory` in the loading thread. Overrides
+        the private `DirectoryTree._directory_content` of textual 4.0.0.
+
+        Args:
+            location: the directory to load.
+            worker: the worker the loading is taking place in.
+
+        Yields: the paths of the entries in the directory.
+        """
+        try:
+            listing = scan_directory(str(location), os.stat(location).st_mtime_ns)
+        except OSError:
+            return
+
+        for path in listing:
+            if worker.is_cancelled:
+                break
+            yield path
 
     def action_back_dir(self) -> None:
         """Moves up a directory."""
-        parent = Path(self.path).resolve().parent
-        self.path = parent
+        # the path is already absolute and normalized, it is either the working directory or a
+        # selected directory
+        self.navigate(Path(self.path).parent)
 
     def on_directory_tree_directory_selected(
         self, event: DirectoryTree.DirectorySelected
@@ -84,7 +156,9 @@ class DirectoryNav(DirectoryTree):
         Args:
             event: directory selected event.
         """
-        self.path = Path(event.path).resolve()
+        # the selected path is built from the absolute root of the tree so it only needs to be
+        # normalized, resolving it would stat every component
+        self.navigate(Path(os.path.normpath(event.path)))
 
 
 class Erys(App):
@@ -103,34 +177,43 @@ class Erys(App):
     def __init__(self, paths: list[str]) -> None:
         super().__init__()
         self.theme = "textual-dark"
-        # check if the provided file paths are python notebooks
+        # check if the provided file paths are python notebooks. notebooks that don't exist yet
+        # are kept if their directory exists so that they can be created
+        self._cwd = Path.cwd()  # the app never changes directory so it is resolved once
+        self._cwd_prefix = os.path.join(self._cwd, "")  # the cwd with a trailing separator
+        self._relpaths: dict[str, str] = {}  # maps from a path to the path relative to the cwd
         self.paths = [
-            os.path.relpath(path, Path.cwd())
+            self._relpath(path)
             for path in paths
-            if Path(path).suffix == ".ipynb" and (Path(path).exists() or Path(path).parent.is_dir())
+            if os.path.splitext(path)[1] == ".ipynb"
+            and (os.path.exists(path) or os.path.isdir(os.path.dirname(path) or os.curdir))
         ]
         self.cur_tab = len(paths)
-        self.tab_to_nb_id_map: dict[str, int] = {}  # maps from tab id to notebook id
+        self.tab_to_nb_id_map: dict[str, str] = {}  # maps from tab id to notebook id
+        self._tab_paths: dict[str, str] = {}  # maps from tab id to notebook path
+        self._path_to_tab_id: dict[str, str] = {}  # maps from notebook path to tab id
+        # notebooks that have a tab but are only mounted once their tab is activated
+        self._pending_notebooks: dict[str, str] = {}  # maps from notebook id to path
+        self.current_notebook: Notebook | None = None  # notebook shown in the switcher
+        self.dir_tree: DirectoryNav | None = None  # created the first time it is displayed
 
     def compose(self) -> ComposeResult:
         """Composed with:
         - App
             - Header
             - Horizontal
-                - DirectoryNav (id=file-tree)
+                - DirectoryNav (id=file-tree, mounted when first displayed)
                 - Vertical
                     - Tabs
                     - ContentSwitcher (id=tab-content)
-                        - Notebook
+                        - Notebook (only the first, the rest are mounted when activated)
             - Footer
         """
 
         yield Header(show_clock=True, time_format="%I:%M:%S %p")
 
-        with Horizontal():
-            self.dir_tree = DirectoryNav(Path.cwd(), id="file-tree")
-            yield self.dir_tree
-
+        self.main_container = Horizontal()
+        with self.main_container:
             with Vertical():
                 self.tabs = Tabs(
                     *[Tab(path, id=f"tab{idx}") for idx, path in enumerate(self.paths)]
@@ -139,8 +222,13 @@ class Erys(App):
                 self.switcher = ContentSwitcher(id="tab-content")
                 with self.switcher:
                     for idx, path in enumerate(self.paths):
-                        self.tab_to_nb_id_map[path] = f"tab{idx}"
-                        yield Notebook(path, f"tab{idx}", self)
+                        self.tab_to_nb_id_map[f"tab{idx}"] = f"tab{idx}"
+                        self._tab_paths[f"tab{idx}"] = path
+                        self._path_to_tab_id[path] = f"tab{idx}"
+                        if idx == 0:
+                            yield Notebook(path, f"tab{idx}", self)
+                        else:
+                            self._pending_notebooks[f"tab{idx}"] = path
 
         yield Footer()
 
@@ -152,10 +240,10 @@ class Erys(App):
             self.action_new_notebook()
 
         self.tabs.focus()
-        self.dir_tree.display = False
 
     def on_tabs_tab_activated(self, event: Tabs.TabActivated) -> None:
         """Tab activated event handler that switches content to show notebook the tab belongs to.
+        Mounts the notebook first if it has not been mounted yet.
 
         Args:
             event: tab activated event.
@@ -163,8 +251,14 @@ class Erys(App):
         if event.tab is None:
             pass
         else:
-            notebook_id = self.tab_to_nb_id_map[str(event.tab.label)]
+            notebook_id = self.tab_to_nb_id_map[event.tab.id]
+            if path := self._pending_notebooks.pop(notebook_id, None):
+                # keep the focus where it is like the notebooks mounted on startup
+                self.switcher.mount(
+                    Notebook(path, notebook_id, self, focus_on_mount=False)
+                )
             self.switcher.current = f"{notebook_id}"
+            self.current_notebook = self.switcher.get_child_by_id(notebook_id, Notebook)
 
     def on_directory_tree_file_selected(
         self, event: DirectoryTree.FileSelected
@@ -175,16 +269,17 @@ class Erys(App):
         Args:
             event: file selected event.
         """
-        if not os.path.exists(event.path):
-            self.notify(f"{event.path} does not exist.", severity="error", timeout=8)
-            return
-
+        # check the extension first since it does not need a syscall
         if event.path.suffix != ".ipynb":
             self.notify(
                 f"{event.path} is not a jupyter notebook.", severity="error", timeout=8
             )
             return
 
+        if not os.path.exists(event.path):
+            self.notify(f"{event.path} does not exist.", severity="error", timeout=8)
+            return
+
         self.open_notebook(event.path)
 
     def on_key(self, event: Key) -> None:
@@ -195,28 +290,31 @@ class Erys(App):
         Args:
             event: key event.
         """
-        match event.key:
-            case "escape":
-                self.set_focus(self.tabs)
-            case "enter":
-                if not self.switcher.current:
-                    return
-
-                # if currently focused on the tabs, change focus to the latest notebook
-                if isinstance(self.app.focused, Tabs):
-                    notebook = self.switcher.query_one(
-                        f"#{self.switcher.current}", Notebook
-                    )
-                    self.call_next(notebook.focus_notebook)
+        if event.key == "escape":
+            self.set_focus(self.tabs)
+        elif event.key == "enter":
+            if not self.switcher.current:
+                return
+
+            # if currently focused on the tabs, change focus to the latest notebook
+            if isinstance(self.app.focused, Tabs):
+                self.call_next(self.current_notebook.focus_notebook)
 
     def action_toggle_directory_tree(self) -> None:
-        """Toggle whether the directory tree is displayed."""
-        self.dir_tree.display = not self.dir_tree.display
+        """Toggle whether the directory tree is displayed. The directory tree is created and
+        mounted the first time it is displayed so the working directory is only read if needed.
+        """
+        if self.dir_tree is None:
+            self.dir_tree = DirectoryNav(self._cwd, id="file-tree")
+            self.main_container.mount(self.dir_tree, before=0)
+            self.dir_tree.display = True
+        else:
+            self.dir_tree.display = not self.dir_tree.display
+
         if self.dir_tree.display:
-            self.set_focus(self.dir_tree)
-        elif cur_notebook := self.switcher.current:
-            notebook = self.switcher.query_one(f"#{cur_notebook}", Notebook)
-            self.call_next(notebook.focus_notebook)
+            self.call_after_refresh(self.set_focus, self.dir_tree)
+        elif self.switcher.current:
+            self.call_next(self.current_notebook.focus_notebook)
         else:
             self.set_focus(self.tabs)
 
@@ -227,6 +325,8 @@ class Erys(App):
         # add a new tab
         self.tabs.add_tab(Tab(tab_id, id=tab_id))
         self.tab_to_nb_id_map[tab_id] = tab_id
+        self._tab_paths[tab_id] = tab_id
+        self._path_to_tab_id[tab_id] = tab_id
 
         new_notebook = Notebook("new_empty_terminal_notebook", tab_id, self)
         self.switcher.mount(new_notebook)
@@ -244,38 +344,67 @@ class Erys(App):
         # if a tab is active then remove it and the notebook
         if active_tab is not None:
             self.tabs.remove_tab(active_tab.id)
-            notebook_id = self.tab_to_nb_id_map[active_tab.label]
+            notebook_id = self.tab_to_nb_id_map.pop(active_tab.id)
+            self._path_to_tab_id.pop(self._tab_paths.pop(active_tab.id), None)
+            self._pending_notebooks.pop(notebook_id, None)
             self.switcher.remove_children(f"#{notebook_id}")
-            del self.tab_to_nb_id_map[active_tab.label]
 
         # set the switcher's currently displayed widget to none to avoid errors
         if len(self.tab_to_nb_id_map) == 0:
             self.switcher.current = None
+            self.current_notebook = None
 
     def action_clear(self) -> None:
         """Clear the tabs."""
         self.tabs.clear()
-        for child in self.switcher.children:
-            child.remove()
+        self.switcher.remove_children()
 
         # clear the map and the switcher's currently displayed widget to avoid errors
-        self.tab_to_nb_id_map = {}
+        self.tab_to_nb_id_map.clear()
+        self._tab_paths.clear()
+        self._path_to_tab_id.clear()
+        self._pending_notebooks.clear()
+        self._relpaths.clear()
         self.switcher.current = None
+        self.current_notebook = None
+
+    def _relpath(self, path: str | Path) -> str:
+        """Get a path relative to the working directory, which is how notebooks are labeled.
+
+        Args:
+            path: the path to make relative.
+
+        Returns: the relative path.
+        """
+        key = os.fspath(path)
+        if key not in self._relpaths:
+            # normalized paths inside the cwd (like the ones from the directory tree) only need
+            # the prefix removed instead of the component comparison in `os.path.relpath`
+            if key.startswith(self._cwd_prefix) and os.path.normpath(key) == key:
+                self._relpaths[key] = key[len(self._cwd_prefix) :]
+            else:
+                self._relpaths[key] = os.path.relpath(path, self._cwd)
+        return self._relpaths[key]
 
     def change_tab_name(self, tab_id: str, new_path: str) -> None:
-        """Update the key in the map from tab id to notebook id. Used when saving a new file to
+        """Update the key in the map from notebook path to tab id. Used when saving a new file to
         update the map and the Tab label.
         
         Args:
             tab_id: the tab id for the notebook with the new path.
             new_path: the new path for the notebook.
         """
-        if tab_id not in self.tab_to_nb_id_map:
-            pass
+        if tab_id not in self._tab_paths:
+            return
+
+        path = self._relpath(new_path)
+        # move the tab id from the old path to the new one
+        self._path_to_tab_id.pop(self._tab_paths[tab_id], None)
+        self._path_to_tab_id[path] = tab_id
+        self._tab_paths[tab_id] = path
 
-        path = os.path.relpath(new_path, Path.cwd())
         target_tab: Tab = self.tabs.query_one(f"#{tab_id}", Tab)
-        target_tab.update(path)
+        target_tab.label = path
 
 
     def open_notebook(self, path: Path) -> None:
@@ -285,10 +414,10 @@ class Erys(App):
         Args:
             path: path to the notebook.
         """
-        path = os.path.relpath(path, Path.cwd())
+        path = self._relpath(path)
 
-        if path in self.tab_to_nb_id_map:
-            self.tabs.active = self.tab_to_nb_id_map[path]
+        if path in self._path_to_tab_id:
+            self.tabs.active = self._path_to_tab_id[path]
             return
 
         tab_id = f"tab{self.cur_tab}"
@@ -299,7 +428,9 @@ class Erys(App):
         self.tabs.active = tab_id
 
         self.switcher.mount(new_notebook)
-        self.tab_to_nb_id_map[path] = tab_id
+        self.tab_to_nb_id_map[tab_id] = tab_id
+        self._tab_paths[tab_id] = path
+        self._path_to_tab_id[path] = tab_id
         self.cur_tab += 1
 
 
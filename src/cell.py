@@ -2,22 +2,57 @@ from textual.widgets import TextArea, Label, Static
 from textual.events import MouseDown, Key, Enter, Leave
 from textual.reactive import var
 from textual.containers import VerticalGroup
+from textual.widget import Widget
 from textual.binding import Binding
 
 from time import time
+import asyncio
 import pyperclip
 from typing import Any
-import uuid
+from itertools import count
+from secrets import token_hex
+import re
 
 DOUBLE_CLICK_INTERVAL = 0.4  # Threshold for interval between mousedown in seconds
 COLLAPSED_COLOR = "green"
 EXPANDED_COLOR = "white"
+FIRST_LINE_REGEX = re.compile(r"[^\r\n]+")  # first non-empty line, used as the placeholder
 
 
 # https://github.com/jupyter/enhancement-proposals/blob/master/62-cell-id/cell-id.md
 def get_cell_id(id_length=8):
     """Generate the cell id for cells in notebook."""
-    return uuid.uuid4().hex[:id_length]
+    # only generate the random bytes needed for the hex digits
+    return token_hex((id_length + 1) // 2)[:id_length]
+
+
+_widget_ids = count()  # counter for the cell widget ids
+
+
+def get_widget_id() -> str:
+    """Generate the widget id for a cell. Only needs to be unique while the app is running
+    since, unlike the cell id, it is never saved to the notebook.
+    """
+    return f"cell-{next(_widget_ids)}"
+
+
+def copy_to_clipboard(widget: Widget, text: str) -> None:
+    """Copy text to the system clipboard in the event loop's executor since pyperclip can start
+    a subprocess (xclip, wl-copy, ...) for every copy. A failed copy is reported with a
+    notification from `widget`.
+
+    Args:
+        widget: the widget the text is copied from.
+        text: the text to copy.
+    """
+
+    def report_error(future: asyncio.Future) -> None:
+        """Notify the user if the copy raised."""
+        if not future.cancelled() and (error := future.exception()):
+            widget.notify(f"Failed to copy: {error}", severity="error", timeout=8)
+
+    future = asyncio.get_running_loop().run_in_executor(None, pyperclip.copy, text)
+    future.add_done_callback(report_error)
 
 
 class StaticBtn(Static):
@@ -41,9 +76,15 @@ class CollapseLabel(Label):
         self, parent_cell: "Cell", collapsed: bool = False, id: str = ""
     ) -> None:
         super().__init__("\n┃\n┃", id=id)
-        self.collapsed = collapsed
         self.parent_cell: Cell = parent_cell
         self.prev_switcher = None
+        # the cell's switcher is created in compose, the initial state is applied on mount
+        self.set_reactive(CollapseLabel.collapsed, collapsed)
+
+    def on_mount(self) -> None:
+        """Apply the initial collapsed state once the cell's widgets are mounted."""
+        if self.collapsed:
+            self.call_after_refresh(self.watch_collapsed, True)
 
     def on_click(self) -> None:
         """Toggle the collapsed state on clicks."""
@@ -56,32 +97,34 @@ class CollapseLabel(Label):
         Args:
             collapsed: updated collapsed state.
         """
-        if collapsed:
-            # get the placeholder from the input text and set the collapsed display to it
-            placeholder = self.get_placeholder(self.parent_cell.input_text.text)
-            self.parent_cell.collapsed_display.update(f"{placeholder}...")
-            self.prev_switcher = self.parent_cell.switcher.current
-
-            self.parent_cell.switcher.current = "collapsed-display"
-
-            if (
-                self.parent_cell.cell_type == "code"
-            ):  # if code cell, hide the execution count
-                self.parent_cell.exec_count_display.display = False
-
-            self.styles.color = COLLAPSED_COLOR
-            self.update("\n┃")
-        else:
-            # set the switcher to the previous widget it was displaying
-            self.parent_cell.switcher.current = self.prev_switcher
+        # apply the switcher, display and style changes in a single refresh
+        with self.app.batch_update():
+            if collapsed:
+                # get the placeholder from the input text and set the collapsed display to it
+                placeholder = self.get_placeholder(self.parent_cell.input_text.text)
+                self.parent_cell.collapsed_display.update(f"{placeholder}...")
+                self.prev_switcher = self.parent_cell.switcher.current
+
+                self.parent_cell.switcher.current = "collapsed-display"
+
+                if (
+                    self.parent_cell.cell_type == "code"
+                ):  # if code cell, hide the execution count
+                    self.parent_cell.exec_count_display.display = False
+
+                self.styles.color = COLLAPSED_COLOR
+                self.update("\n┃")
+            else:
+                # set the switcher to the previous widget it was displaying
+                self.parent_cell.switcher.current = self.prev_switcher
 
-            if (
-                self.parent_cell.cell_type == "code"
-            ):  # if code cell, display the execution count
-                self.parent_cell.exec_count_display.display = True
+                if (
+                    self.parent_cell.cell_type == "code"
+                ):  # if code cell, display the execution count
+                    self.parent_cell.exec_count_display.display = True
 
-            self.styles.color = EXPANDED_COLOR
-            self.update("\n┃\n┃")
+                self.styles.color = EXPANDED_COLOR
+                self.update("\n┃\n┃")
 
     def get_placeholder(self, text: str) -> str:
         """Get the placeholder to represent the cell's text area. Either the first line or an
@@ -92,13 +135,9 @@ class CollapseLabel(Label):
 
         Returns: placeholder representing the collapsed input text.
         """
-        split = text.splitlines()
-        if len(split) == 0:
-            return ""
-
-        for line in split:
-            if line != "":
-                return line
+        # search stops at the first non-empty line instead of splitting the whole text
+        first_line = FIRST_LINE_REGEX.search(text)
+        return first_line.group() if first_line else ""
 
 
 class CopyTextArea(TextArea):
@@ -106,9 +145,9 @@ class CopyTextArea(TextArea):
 
     def on_key(self, event: Key) -> None:
         """Key event handler to copy selected text to system clipboard when ctrl+c is pressed."""
-        match event.key:
-            case "ctrl+c":
-                pyperclip.copy(self.selected_text)
+        if event.key == "ctrl+c":
+            copy_to_clipboard(self, self.selected_text)
+            event.prevent_default()  # the base classes' handlers would copy again
 
 
 class SplitTextArea(CopyTextArea):
@@ -125,20 +164,21 @@ class SplitTextArea(CopyTextArea):
         Args:
             event: Key event.
         """
-        match event.key:
-            case "ctrl+c":
-                pyperclip.copy(self.selected_text)
-            case "escape":
-                cell: Cell = self.parent.parent.parent
-                cell.escape(event)
+        if event.key == "ctrl+c":
+            copy_to_clipboard(self, self.selected_text)
+            event.prevent_default()  # the base classes' handlers would copy again
+        elif event.key == "escape":
+            cell: Cell = self.parent.parent.parent
+            cell.escape(event)
 
     def action_split_cell(self) -> None:
         """Creates new cell of the same type as parent."""
 
         # parent cell containing widget
         cell: Cell = self.parent.parent.parent
+        # take both parts from the document instead of slicing a copy of the whole text
         string_to_keep = self.get_text_range((0, 0), self.cursor_location)
-        string_for_new_cell = self.text[len(string_to_keep) :]
+        string_for_new_cell = self.get_text_range(self.cursor_location, self.document.end)
 
         self.load_text(string_to_keep)
 
@@ -154,6 +194,7 @@ class Cell(VerticalGroup):
 
     can_focus = True
     _last_click_time: float = 0.0  # keep track of the last mouse click
+    _border_left: tuple[str, str] | None = None  # the left border last set on the cell
     merge_select: bool = var(False, init=False)  # whether cell is selected for merging
 
     # pointers to the next and prevous cells in the notebook
@@ -174,16 +215,18 @@ class Cell(VerticalGroup):
         notebook,
         source: str,
         language: str,
-        metadata: dict[str, Any] = {},
+        metadata: dict[str, Any] | None = None,
         cell_id: str | None = None,
+        id: str | None = None,
     ) -> None:
         super().__init__()
         self.notebook = notebook  # notebook cell belongs to
         self.source = source
-        self._metadata = metadata
-        self._cell_id = cell_id or get_cell_id()
-        self.id = f"_{self._cell_id}"
-        self._collapsed = metadata.get("collapsed", False)
+        # a new dict per cell so that cells without metadata do not share one
+        self._metadata = {} if metadata is None else metadata
+        self._cell_id = cell_id  # generated when the cell is first serialized if missing
+        self.id = id or get_widget_id()  # clones keep the id so the undo stack can find them
+        self._collapsed = self._metadata.get("collapsed", False)
         self._language = language
 
         self.collapse_btn = CollapseLabel(
@@ -198,37 +241,36 @@ class Cell(VerticalGroup):
         Args:
             event: Key press event.
         """
-        match event.key:
-            case "enter":
-                await self.open()
+        if event.key == "enter":
+            await self.open()
 
     def _on_focus(self):
         """Focus event handler that adds border."""
         if not self.merge_select:
-            self.styles.border_left = "solid", "lightblue"
+            self.set_border_left(("solid", "lightblue"))
         # self.styles.border = "solid", "lightblue"
         # self.border_subtitle = self._language
 
     def _on_blur(self):
         """Blur event handler that removes border if not selected for merge."""
         if not self.merge_select:
-            self.styles.border = None
+            self.set_border_left(None)
 
     def on_enter(self, event: Enter) -> None:
         """Mouse enter event handler that adds border if not selected for merge and not focused."""
         if self.merge_select:
             return
 
-        if self.notebook.last_focused != self:
-            self.styles.border_left = "solid", "grey"
+        if self.notebook.last_focused is not self:
+            self.set_border_left(("solid", "grey"))
 
     def on_leave(self, event: Leave) -> None:
         """Mouse leave event handler that removes border if not selected for merge and not focused."""
         if self.merge_select:
             return
 
-        if self.notebook.last_focused != self:
-            self.styles.border_left = None
+        if self.notebook.last_focused is not self:
+            self.set_border_left(None)
 
     def on_mouse_down(self, event: MouseDown) -> None:
         """Mouse down event handler. Add cell to the merge list if ctrl is held. If the time
@@ -240,9 +282,9 @@ class Cell(VerticalGroup):
         now = time()
         if event.ctrl:
             if not self.merge_select:
-                self.notebook._merge_list.append(self)
+                self.notebook._merge_list[self] = None
             else:
-                self.notebook._merge_list.remove(self)
+                del self.notebook._merge_list[self]
 
             self.merge_select = not self.merge_select
         elif now - self._last_click_time <= DOUBLE_CLICK_INTERVAL:
@@ -257,9 +299,20 @@ class Cell(VerticalGroup):
             selected: whether cell is selected for merging.
         """
         if selected:
-            self.styles.border_left = "solid", "yellow"
+            self.set_border_left(("solid", "yellow"))
         else:
-            self.styles.border_left = None
+            self.set_border_left(None)
+
+    def set_border_left(self, border: tuple[str, str] | None) -> None:
+        """Set the left border of the cell if it is different from the current one. Setting the
+        styles parses the color and can refresh the cell even when nothing changed.
+
+        Args:
+            border: the border type and color, or None to remove the border.
+        """
+        if border != self._border_left:
+            self._border_left = border
+            self.styles.border_left = border
 
     def action_join_above(self) -> None:
         """Merges cell with the previous cell."""
@@ -291,8 +344,15 @@ class Cell(VerticalGroup):
 
         return next_focus, position
 
+    @property
+    def cell_id(self) -> str:
+        """The id of the cell in the notebook. Generated the first time it is needed."""
+        if not self._cell_id:
+            self._cell_id = get_cell_id()
+        return self._cell_id
+
     def set_new_id(self) -> None:
-        """Update cell id with a new uuid."""
+        """Update cell id with a new random id."""
         self._cell_id = get_cell_id()
 
     def merge_cells_with_self(self, cells) -> None:
@@ -303,15 +363,15 @@ class Cell(VerticalGroup):
         Args:
             cells: List of MarkdownCell | CodeCell to merge with self.
         """
-        source = self.input_text.text
+        sources = [self.input_text.text]
 
         for cell in cells:
-            source += "\n"
-            source += cell.input_text.text
+            sources.append(cell.input_text.text)
             cell.disconnect()
             cell.remove()
 
-        self.input_text.load_text(source)
+        # join once instead of growing the string for every merged cell
+        self.input_text.load_text("\n".join(sources))
         self.focus()
 
     def on_double_click(self, event: MouseDown) -> None:
@@ -323,7 +383,7 @@ class Cell(VerticalGroup):
         raise NotImplementedError()
 
     @staticmethod
-    def from_nb(nb: dict[str, Any], notebook) -> "Cell":
+    def from_nb(nb: dict[str, Any], notebook, id: str | None = None) -> "Cell":
         """Static method to generate a `Cell` from a json/dict that represent a cell."""
         raise NotImplementedError()
 
@@ -5,15 +5,21 @@ from textual.reactive import var
 from textual.containers import HorizontalGroup, VerticalGroup, VerticalScroll
 from textual.widgets import Static, Label, ContentSwitcher, Pretty
 from textual.events import Key, DescendantBlur, Click
+from textual.widget import Widget
+from textual.strip import Strip
 
 import re
+import os
+import atexit
 import tempfile
 import webbrowser
 import base64
 from io import BytesIO
 from PIL import Image
-from asyncio import to_thread
+from asyncio import to_thread, get_running_loop
 from rich.text import Text
+from itertools import groupby
+from functools import lru_cache
 from typing import Any
 
 from .notebook_kernel import NotebookKernel
@@ -26,14 +32,119 @@ from .cell import (
     EXPANDED_COLOR,
 )
 
+ANSI_CACHE_SIZE = 128  # number of converted small ansi outputs shared across cells
+LARGE_OUTPUT_LINES = 500  # outputs with more lines only render the lines that are visible
+THREADED_ANSI_SIZE = 4096  # outputs longer than this are converted to rich text in a thread
+ANSI_ESCAPE_REGEX = re.compile(r"\x1b\[[0-9;]*m")  # ansi color escapes removed for plain output
+_exec_count_labels: dict[int | None, str] = {None: "[ ]"}  # cache of execution count labels
+
+
+def get_exec_count_label(exec_count: int | None) -> str:
+    """Get the label displaying the execution count of a code cell. Labels are cached so cells
+    with the same execution count share the string.
+
+    Args:
+        exec_count: the execution count of the code cell.
+
+    Returns: the execution count label.
+    """
+    label = _exec_count_labels.get(exec_count)
+    if label is None:
+        label = _exec_count_labels[exec_count] = f"[{exec_count or ' '}]"
+    return label
+
+
+def ansi_to_text(ansi_string: str) -> Text:
+    """Convert a string with ansi escapes to rich text. Outputs up to `THREADED_ANSI_SIZE` long are
+    cached so outputs that are displayed again (cells that are re-run with the same output, moved,
+    pasted or cloned) are not parsed again. Larger outputs are not cached so the cache does not
+    keep them alive after their cells are gone.
+
+    Args:
+        ansi_string: the string with ansi escapes.
+
+    Returns: the styled text.
+    """
+    if len(ansi_string) > THREADED_ANSI_SIZE:
+        return _convert_ansi(ansi_string)
+    return _cached_convert_ansi(ansi_string)
+
+
+def _convert_ansi(ansi_string: str) -> Text:
+    """Convert a string with ansi escapes to rich text.
+
+    Args:
+        ansi_string: the string with ansi escapes.
+
+    Returns: the styled text.
+    """
+    if "\x1b" not in ansi_string and "\r" not in ansi_string:
+        # nothing for the ansi decoder to do, it would only split and rejoin the lines
+        return Text(ansi_string)
+    return Text.from_ansi(ansi_string)
+
+
+# the text is only read by the widgets displaying it so it can be shared
+_cached_convert_ansi = lru_cache(maxsize=ANSI_CACHE_SIZE)(_convert_ansi)
+
+
+def join_multiline(text: list[str] | str) -> str:
+    """Join a notebook multiline string, which is either a string or a list of lines that keep
+    their newlines.
+
+    Args:
+        text: the multiline string.
+
+    Returns: the joined string.
+    """
+    return text if isinstance(text, str) else "".join(text)
+
+
+def remove_file(path: str) -> None:
+    """Remove a file if it still exists. Used to clean up the temporary files of html outputs.
+
+    Args:
+        path: path of the file.
+    """
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def coalesce_streams(outputs: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Merge consecutive stream outputs to the same stream (stdout/stderr) into one output so
+    they are displayed by a single widget. The outputs themselves are not modified.
+
+    Args:
+        outputs: list of serialized outputs.
+
+    Returns: list of outputs with the consecutive streams merged.
+    """
+    coalesced = []
+    # consecutive streams with the same name are grouped together, other outputs have no name
+    stream_name = lambda output: output.get("name") if output["output_type"] == "stream" else None
+    for name, group in groupby(outputs, key=stream_name):
+        if name is None:
+            coalesced.extend(group)
+        else:
+            # streams are always copied so the outputs themselves are not modified
+            group = list(group)
+            text = "".join(join_multiline(output["text"]) for output in group)
+            coalesced.append({**group[0], "text": text})
+    return coalesced
+
 
 class OutputCollapseLabel(Label):
     """Custom label to use as the collapse button for the output of a code cell."""
 
     collapsed = var(False, init=False)  # keep track of collapse state
 
-    def __init__(self, collapsed: bool = False, id: str = "") -> None:
+    def __init__(
+        self, code_cell: "CodeCell", collapsed: bool = False, id: str = ""
+    ) -> None:
         super().__init__("\n┃", id=id)
+        self.code_cell: CodeCell = code_cell
         self.collapsed = collapsed
 
     def on_click(self) -> None:
@@ -46,14 +157,15 @@ class OutputCollapseLabel(Label):
         Args:
             collapsed: updated collapsed state.
         """
-        code_cell: CodeCell = self.parent.parent
+        code_cell = self.code_cell
 
-        if collapsed and len(code_cell.outputs) > 0:
-            code_cell.output_switcher.current = "collapsed-output"
-            self.styles.color = COLLAPSED_COLOR
-        else:
-            code_cell.output_switcher.current = "outputs"
-            self.styles.color = EXPANDED_COLOR
+        with self.app.batch_update():
+            if collapsed and len(code_cell.outputs) > 0:
+                code_cell.output_switcher.current = "collapsed-output"
+                self.styles.color = COLLAPSED_COLOR
+            else:
+                code_cell.output_switcher.current = "outputs"
+                self.styles.color = EXPANDED_COLOR
 
 
 class RunLabel(Label):
@@ -63,13 +175,14 @@ class RunLabel(Label):
     glyphs = {False: "▶", True: "□"}  # glyphs representing running state
     toolips = {False: "Run", True: "Interrupt"}
 
-    def __init__(self, id: str = "") -> None:
+    def __init__(self, code_cell: "CodeCell", id: str = "") -> None:
         super().__init__(self.glyphs[False], id=id)
         self.tooltip = self.toolips[False]
+        self.code_cell: CodeCell = code_cell
 
     def on_click(self) -> None:
         """Button to run or interrupt code cell."""
-        code_cell: CodeCell = self.parent.parent.parent.parent
+        code_cell = self.code_cell
 
         if not self.running:
             self.run_worker(code_cell.run_cell)
@@ -82,14 +195,42 @@ class RunLabel(Label):
         Args:
             is_running: whether the code cell is running.
         """
-        self.update(self.glyphs[is_running])
-        self.tooltip = self.toolips[is_running]
+        with self.app.batch_update():
+            self.update(self.glyphs[is_running])
+            self.tooltip = self.toolips[is_running]
 
 
 class CodeArea(SplitTextArea):
     """Widget used for editing code. Inherits from the SplitTextArea."""
 
     closing_map = {"{": "}", "(": ")", "[": "]", "'": "'", '"': '"'}
+    # text inserted for each opening character, built once instead of on every key press
+    closing_pairs = {opening: opening + closing for opening, closing in closing_map.items()}
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        # language attached on first render so cells that are never shown skip the parse
+        self.deferred_language: str | None = None
+
+    def render_line(self, y: int) -> Strip:
+        """Render a single line of the text area. Attaches the deferred language the first
+        time the widget is rendered so the syntax tree is only built for cells that are shown.
+
+        Args:
+            y: Y coordinate of the line relative to the widget region.
+
+        Returns: the rendered line.
+        """
+        if self.deferred_language is not None:
+            language, self.deferred_language = self.deferred_language, None
+            self.call_next(setattr, self, "language", language)
+        return super().render_line(y)
+
+    def on_mount(self) -> None:
+        """Mount event handler that keeps a reference to the code cell the widget belongs to
+        so it does not need to be looked up on key presses.
+        """
+        self.code_cell: CodeCell = self.parent.parent.parent
 
     def on_key(self, event: Key) -> None:
         """Key press event handler to close brackets and quotes.
@@ -97,16 +238,21 @@ class CodeArea(SplitTextArea):
         Args:
             event: Key press event.
         """
-        if event.key == "ctrl+r":
-            code_cell: CodeCell = self.parent.parent.parent
-            if not code_cell.run_label.running:
-                self.run_worker(code_cell.run_cell)
-        elif event.character in self.closing_map:
-            self.insert(f"{event.character}{self.closing_map[event.character]}")
-            self.move_cursor_relative(columns=-1)
+        character = event.character
+        # a single lookup for the pair on the typing path
+        pair = self.closing_pairs.get(character) if character else None
+        if pair is not None:
+            # insert the pair and move between them in a single screen update
+            with self.app.batch_update():
+                self.insert(pair)
+                self.move_cursor_relative(columns=-1)
             event.prevent_default()
             return
 
+        if event.key == "ctrl+r":
+            if not self.code_cell.run_label.running:
+                self.run_worker(self.code_cell.run_cell)
+
         super().on_key(event)
 
 
@@ -118,21 +264,24 @@ class OutputJson(HorizontalGroup):
     def __init__(self, data):
         super().__init__()
         self.data = data
-        self.output_text = OutputText(str(self.data), id="plain-json")
+        self.output_text: OutputText | None = None  # created the first time it is focused
 
     def compose(self) -> ComposeResult:
         """Composed of
         - Content switcher (initial=pretty-json)
             - Pretty (id=pretty-json)
-            - CopyTextArea (id=plain-json)
+            - CopyTextArea (id=plain-json, mounted the first time the widget is focused)
         """
         self.switcher = ContentSwitcher(initial="pretty-json")
         with self.switcher:
             yield Pretty(self.data, id="pretty-json")
-            yield self.output_text
 
-    def _on_focus(self) -> None:
-        """Switch to plain-json when focusing on widget."""
+    async def _on_focus(self) -> None:
+        """Switch to plain-json when focusing on widget. The text area is only created and
+        mounted the first time since most outputs are never selected."""
+        if self.output_text is None:
+            self.output_text = OutputText(str(self.data), id="plain-json")
+            await self.switcher.mount(self.output_text)
         self.switcher.current = "plain-json"
 
     def on_descendant_blur(self, event: DescendantBlur) -> None:
@@ -170,8 +319,7 @@ class OutputImage(HorizontalGroup):
         super().__init__()
         # image from kernel is returned as a base64 encoded data
         self.base64_data = base64_data
-        self.decoded = BytesIO(base64.b64decode(base64_data))
-        self.image = Image.open(self.decoded)
+        self.image: Image.Image | None = None  # decoded the first time it is displayed
 
         self.display_img_btn = StaticBtn(
             content="🖼 Img", id="display-img-btn"
@@ -184,7 +332,7 @@ class OutputImage(HorizontalGroup):
         """
         yield self.display_img_btn
 
-    def on_click(self, event: Click):
+    async def on_click(self, event: Click):
         """Method to display the image when `StaticBtn` is clicked. Called from `StaticBtn` when it
         is clicked.
 
@@ -192,8 +340,15 @@ class OutputImage(HorizontalGroup):
             event: the original click event from the `StaticBtn`.
         """
         if event.widget == self.display_img_btn:
-            self.image.show()
             event.stop()
+            # decoding and writing the image for the viewer happen off the event loop
+            await to_thread(self.show_image)
+
+    def show_image(self) -> None:
+        """Decode the image the first time it is displayed and open it in the image viewer."""
+        if self.image is None:
+            self.image = Image.open(BytesIO(base64.b64decode(self.base64_data)))
+        self.image.show()
 
 
 class OutputHTML(HorizontalGroup):
@@ -203,11 +358,8 @@ class OutputHTML(HorizontalGroup):
 
     def __init__(self, data: list[str] | str) -> None:
         super().__init__()
-        # image from kernel is returned as a base64 encoded data
-        if isinstance(data, list):
-            self.data = "".join(data)
-        else:
-            self.data = data
+        self.data = join_multiline(data)
+        self.url: str | None = None  # file the html is written to the first time it is opened
 
         self.display_img_btn = StaticBtn(
             content="🖼 HTML", id="display-html-btn"
@@ -228,15 +380,63 @@ class OutputHTML(HorizontalGroup):
             event: the original click event from the `StaticBtn`.
         """
         if event.widget == self.display_img_btn:
-            with tempfile.NamedTemporaryFile("w", delete=False, suffix=".html") as f:
-                f.write(self.data)
-                url = "file://" + f.name
+            if self.url is None:
+                with tempfile.NamedTemporaryFile("w", delete=False, suffix=".html") as f:
+                    f.write(self.data)
+                self.url = "file://" + f.name
+                atexit.register(remove_file, f.name)  # remove the file when the app exits
 
             # Open in default browser
-            webbrowser.open(url)
+            webbrowser.open(self.url)
             event.stop()
 
 
+class OutputLines(Widget):
+    """Widget for displaying large ansi outputs. Only the lines that are visible are rendered
+    and each line is rendered once."""
+
+    def __init__(self, text: Text | None = None, id: str = "") -> None:
+        super().__init__(id=id)
+        self.lines: list[Text] = []
+        self._strips: dict[int, Strip] = {}  # rendered lines by index
+        if text is not None:
+            self.update(text)
+
+    def update(self, text: Text) -> None:
+        """Update the output displayed by the widget.
+
+        Args:
+            text: the converted ansi output.
+        """
+        # splitting the converted text keeps styles that span several lines
+        self.lines = list(text.split("\n", allow_blank=True))
+        self._strips.clear()
+        self.refresh(layout=True)
+
+    def get_content_height(self, container, viewport, width: int) -> int:
+        """One line of content per line of output."""
+        return len(self.lines)
+
+    def render_line(self, y: int) -> Strip:
+        """Render a single line of the output. Called by Textual for visible lines only.
+
+        Args:
+            y: Y coordinate of the line relative to the widget region.
+
+        Returns: the rendered line.
+        """
+        rich_style = self.rich_style
+        width = self.size.width
+        if y >= len(self.lines):
+            return Strip.blank(width, rich_style)
+
+        strip = self._strips.get(y)
+        if strip is None:
+            line = self.lines[y]
+            strip = self._strips[y] = Strip(line.render(self.app.console), line.cell_len)
+        return strip.apply_style(rich_style).crop_extend(0, width, rich_style)
+
+
 class OutputAnsi(VerticalScroll):
     """Widget for displaying ansi output for code cells."""
 
@@ -249,32 +449,78 @@ class OutputAnsi(VerticalScroll):
         else:
             text = ansi_string
 
-        self.plain_string = self.remove_ansi(text)  # remove the ansi
-        self.pretty_string = Text.from_ansi(
-            text
-        )  # convert ansi to markup
+        self.ansi_string = text  # ansi removed when the plain output is first needed
 
-        self.static_output = Static(
-            content=self.pretty_string, id="pretty-output"
-        )
-        self.text_output = OutputText(
-            text=self.plain_string, id="plain-output"
-        )
+        if text.count("\n") < LARGE_OUTPUT_LINES:
+            self.static_output: Static | OutputLines = Static(id="pretty-output")
+        else:
+            # large outputs only render the lines that are scrolled into view
+            self.static_output = OutputLines(id="pretty-output")
+
+        # small outputs are converted right away, larger ones in a thread once mounted
+        if len(text) <= THREADED_ANSI_SIZE:
+            self.static_output.update(ansi_to_text(text))
+        self.text_output: OutputText | None = None  # created the first time it is focused
 
     def compose(self) -> ComposeResult:
         """Composed of
         - HorizontalGroup
             - Content switcher (initial=pretty-output)
-                - Pretty (id=pretty-output)
-                - CopyTextArea (id=plain-output)
+                - Static or OutputLines (id=pretty-output)
+                - CopyTextArea (id=plain-output, mounted the first time the widget is focused)
         """
         self.switcher = ContentSwitcher(initial="pretty-output")
         with self.switcher:
             yield self.static_output
-            yield self.text_output
 
-    def _on_focus(self) -> None:
-        """Switch to plain-output when focusing on widget."""
+    def on_mount(self) -> None:
+        """Start converting large outputs once mounted, without holding up the mount."""
+        if len(self.ansi_string) > THREADED_ANSI_SIZE:
+            self.call_next(self.convert_ansi)
+
+    async def convert_ansi(self) -> None:
+        """Convert the ansi output to rich text in a thread so the interface keeps responding
+        to input while large outputs are parsed."""
+        ansi_string = self.ansi_string
+        pretty_string = await to_thread(ansi_to_text, ansi_string)
+        # the output may have been updated again while it was being converted
+        if ansi_string is self.ansi_string:
+            self.static_output.update(pretty_string)
+
+    def can_display(self, ansi_string: str) -> bool:
+        """Whether the widget can display a new output in place of its current one. Large and
+        small outputs use different widgets for the pretty output.
+
+        Args:
+            ansi_string: the new output.
+
+        Returns: whether the widget can be updated with the output.
+        """
+        is_large = ansi_string.count("\n") >= LARGE_OUTPUT_LINES
+        return is_large == isinstance(self.static_output, OutputLines)
+
+    def update_output(self, ansi_string: str) -> None:
+        """Display a new output in the widget instead of creating a new widget for it.
+
+        Args:
+            ansi_string: the new output.
+        """
+        self.ansi_string = ansi_string
+        if len(ansi_string) <= THREADED_ANSI_SIZE:
+            self.static_output.update(ansi_to_text(ansi_string))
+        else:
+            self.call_next(self.convert_ansi)
+
+        if self.text_output is not None:
+            self.text_output.load_text(self.remove_ansi(ansi_string))
+
+    async def _on_focus(self) -> None:
+        """Switch to plain-output when focusing on widget. The text area is only created and
+        mounted the first time since most outputs are never selected."""
+        if self.text_output is None:
+            plain_string = self.remove_ansi(self.ansi_string)
+            self.text_output = OutputText(text=plain_string, id="plain-output")
+            await self.switcher.mount(self.text_output)
         self.switcher.current = "plain-output"
 
     def on_descendant_blur(self, event: DescendantBlur) -> None:
@@ -297,8 +543,9 @@ class OutputAnsi(VerticalScroll):
 
         Returns: string without ansi escapes.
         """
-        ansi_escape = re.compile(r"\x1b\[[0-9;]*m")
-        return ansi_escape.sub("" , ansi_escaped_string)
+        if "\x1b" not in ansi_escaped_string:
+            return ansi_escaped_string
+        return ANSI_ESCAPE_REGEX.sub("", ansi_escaped_string)
 
 
 class CodeCell(Cell):
@@ -316,30 +563,40 @@ class CodeCell(Cell):
         self,
         notebook,
         source: str = "",
-        outputs: list[dict[str, Any]] = [],
+        outputs: list[dict[str, Any]] | None = None,
         exec_count: int | None = None,
-        metadata: dict[str, Any] = {},
+        metadata: dict[str, Any] | None = None,
         cell_id: str | None = None,
         language: str = "Python",
+        id: str | None = None,
     ) -> None:
-        super().__init__(notebook, source, language, metadata, cell_id)
-        self.outputs: list[dict[str, Any]] = outputs
-        self.exec_count = exec_count
+        super().__init__(notebook, source, language, metadata, cell_id, id)
+        self.outputs: list[dict[str, Any]] = [] if outputs is None else outputs
+        # the displayed (coalesced) outputs and the widgets mounted for each of them
+        self._displayed_outputs: list[tuple[dict[str, Any], list[Widget]]] = []
+        self._outputs_pending = False  # whether an update for outputs received while running is queued
+        # outputs received so far while running, only saved to `outputs` when the run finishes
+        self._received_outputs: list[dict[str, Any]] | None = None
+        self._run_generation = 0  # incremented on every run so older runs do not update the cell
+        # the initial count is shown by the Static created below, so the watcher is not needed
+        self.set_reactive(CodeCell.exec_count, exec_count)
         self.switcher = ContentSwitcher(id="collapse-content", initial="text")
 
-        self.run_label = RunLabel(id="run-button")
-        self.exec_count_display = Static(f"[{self.exec_count or ' '}]", id="exec-count")
+        self.run_label = RunLabel(self, id="run-button")
+        self.exec_count_display = Static(
+            get_exec_count_label(self.exec_count), id="exec-count"
+        )
 
         self.input_text = CodeArea.code_editor(
             self.source,
-            language=self._language.lower(),
             id="text",
             soft_wrap=True,
             theme="vscode_dark",
         )
+        self.input_text.deferred_language = self._language.lower()
 
         self.output_collapse_btn = OutputCollapseLabel(
-            id="output-collapse-button"
+            self, id="output-collapse-button"
         ).with_tooltip("Collapse Output")
 
         self.outputs_group = VerticalGroup(id="outputs")
@@ -384,7 +641,8 @@ class CodeCell(Cell):
         display the outputs.
         """
         self.output_collapse_btn.display = len(self.outputs) > 0
-        self.call_after_refresh(self.update_outputs, self.outputs)
+        if self.outputs:  # nothing to display for cells without outputs
+            self.call_after_refresh(self.update_outputs, self.outputs)
 
     def escape(self, event: Key):
         """Event handler to be called when the escape key is pressed."""
@@ -393,9 +651,7 @@ class CodeCell(Cell):
 
     def watch_exec_count(self, new: int | None) -> None:
         """Watcher for the execution count to update the value of the Static widget when it changes."""
-        self.call_after_refresh(
-            lambda: self.exec_count_display.update(f"[{new or ' '}]")
-        )
+        self.exec_count_display.update(get_exec_count_label(new))
 
     async def action_run_cell(self) -> None:
         """Calls the `run_cell` function."""
@@ -417,12 +673,13 @@ class CodeCell(Cell):
         self.call_after_refresh(self.input_text.focus)
 
     @staticmethod
-    def from_nb(nb: dict[str, Any], notebook) -> "CodeCell":
+    def from_nb(nb: dict[str, Any], notebook, id: str | None = None) -> "CodeCell":
         """Static method to generate a `CodeCell` from a json/dict that represent a code cell.
 
         Args:
             nb: the notebook json/dict format of the code cell.
             notebook: the `Notebook` object the code cell belongs too.
+            id: the widget id to use. A new one is generated if None.
 
         Returns: `CodeCell` from notebook format.
 
@@ -449,6 +706,7 @@ class CodeCell(Cell):
             metadata=nb["metadata"],
             cell_id=nb.get("id", None),
             notebook=notebook,
+            id=id,
         )
 
     def to_nb(self) -> dict[str, Any]:
@@ -473,7 +731,7 @@ class CodeCell(Cell):
         return {
             "cell_type": "code",
             "execution_count": self.exec_count,
-            "id": self._cell_id,
+            "id": self.cell_id,
             "metadata": self._metadata,
             "outputs": self.outputs,
             "source": self.input_text.text,
@@ -499,6 +757,7 @@ class CodeCell(Cell):
             metadata=self._metadata,
             cell_id=self._cell_id,
             language=self._language,
+            id=self.id,
         )
         if connect:
             clone.next = self.next
@@ -513,42 +772,103 @@ class CodeCell(Cell):
         Args:
             outputs: list of serialized outputs.
         """
-        try:
-            self.outputs_group = self.query_one("#outputs", VerticalGroup)
-        except:
+        # the outputs group is created in `__init__`, nothing to update until it is mounted
+        if not self.outputs_group.is_mounted:
             return
 
         self.output_collapse_btn.display = len(outputs) > 0
-        # remove the children widgets first
-        await self.outputs_group.remove_children()
-
-        for output in outputs:
-            match output["output_type"]:
-                case "stream":
-                    # join the strings and display them in the `OutputText` widget
-                    self.outputs_group.mount(OutputAnsi(output["text"]))
-                case "error":
-                    # display the errors with the `OutputError` widget
-                    self.outputs_group.mount(OutputAnsi(output["traceback"]))
-                case "execute_result" | "display_data":
-                    # the display_data and output_result have different formats
-                    for type, data in output["data"].items():
-                        match type:
-                            case "text/plain":
-                                # plain text can also use the `OutputAnsi` widget for display
-                                self.outputs_group.mount(OutputAnsi(data))
-                            case "application/json":
-                                # json is displayed with the `OutputJson` widget
-                                self.outputs_group.mount(OutputJson(data))
-                            case "image/png":
-                                # display the images with the `OutputImage` widget
-                                metadata = output["metadata"]
-                                self.outputs_group.mount(OutputImage(data, metadata))
-                            case "text/html":
-                                # display the html douput with the `OutputHTHML` widget
-                                self.outputs_group.mount(OutputHTML(data))
-
-        self.refresh()
+        if not outputs and not self._displayed_outputs:
+            return
+
+        outputs = coalesce_streams(outputs)
+
+        # keep the widgets of the leading outputs that are the same as the displayed ones
+        kept = 0
+        for (displayed, _), output in zip(self._displayed_outputs, outputs):
+            if displayed != output:
+                break
+            kept += 1
+
+        # outputs displayed by a single `OutputAnsi` are updated in place instead of replaced
+        for (_, widgets), output in zip(self._displayed_outputs[kept:], outputs[kept:]):
+            ansi_string = self.ansi_output(output)
+            if (
+                ansi_string is None
+                or len(widgets) != 1
+                or not isinstance(widgets[0], OutputAnsi)
+                or not widgets[0].can_display(ansi_string)
+            ):
+                break
+            widgets[0].update_output(ansi_string)
+            self._displayed_outputs[kept] = (output, widgets)
+            kept += 1
+
+        # create the widgets for the new outputs first and mount them together
+        new_outputs = [(output, self.output_widgets(output)) for output in outputs[kept:]]
+
+        # remove the widgets of the outputs that changed and mount the new ones in one update
+        with self.app.batch_update():
+            await self.outputs_group.remove_children(
+                [widget for _, widgets in self._displayed_outputs[kept:] for widget in widgets]
+            )
+            await self.outputs_group.mount_all(
+                [widget for _, widgets in new_outputs for widget in widgets]
+            )
+        self._displayed_outputs = self._displayed_outputs[:kept] + new_outputs
+
+    @staticmethod
+    def ansi_output(output: dict[str, Any]) -> str | None:
+        """Get the text of an output that is displayed by a single `OutputAnsi` widget.
+
+        Args:
+            output: the serialized output.
+
+        Returns: the ansi string of the output or None if it is displayed by other widgets.
+        """
+        match output["output_type"]:
+            case "stream":
+                return join_multiline(output["text"])
+            case "error":
+                return "\n".join(output["traceback"])
+            case "execute_result" | "display_data" if output["data"].keys() == {"text/plain"}:
+                return join_multiline(output["data"]["text/plain"])
+        return None
+
+    @staticmethod
+    def output_widgets(output: dict[str, Any]) -> list[Widget]:
+        """Create the widgets to display an output of the code cell.
+
+        Args:
+            output: the serialized output.
+
+        Returns: the widgets for the output.
+        """
+        match output["output_type"]:
+            case "stream":
+                # join the strings and display them in the `OutputText` widget
+                return [OutputAnsi(join_multiline(output["text"]))]
+            case "error":
+                # display the errors with the `OutputError` widget
+                return [OutputAnsi(output["traceback"])]
+            case "execute_result" | "display_data":
+                # the display_data and output_result have different formats
+                widgets = []
+                for type, data in output["data"].items():
+                    match type:
+                        case "text/plain":
+                            # plain text can also use the `OutputAnsi` widget for display
+                            widgets.append(OutputAnsi(join_multiline(data)))
+                        case "application/json":
+                            # json is displayed with the `OutputJson` widget
+                            widgets.append(OutputJson(data))
+                        case "image/png":
+                            # display the images with the `OutputImage` widget
+                            widgets.append(OutputImage(data, output["metadata"]))
+                        case "text/html":
+                            # display the html douput with the `OutputHTHML` widget
+                            widgets.append(OutputHTML(data))
+                return widgets
+        return []
 
     async def run_cell(self) -> None:
         """Run code in code cell with the kernel in a thread. Update the outputs and the
@@ -568,13 +888,48 @@ class CodeCell(Cell):
         if not self.source:  # only call the kernel execute if there is code
             return
 
+        loop = get_running_loop()
+        self._run_generation += 1
+        generation = self._run_generation
+        self._received_outputs = None  # drop the outputs of an earlier run that are not displayed yet
+
+        def on_output(outputs: list[dict[str, Any]]) -> None:
+            # called from the kernel thread, hand the outputs over to the event loop
+            if generation == self._run_generation:
+                loop.call_soon_threadsafe(self.outputs_received, outputs, generation)
+
         self.run_label.running = True  # update the running status for the code cell
-        outputs, execution_count = await to_thread(kernel.run_code, self.source)
+        outputs, execution_count = await to_thread(kernel.run_code, self.source, on_output)
+        if generation != self._run_generation:
+            return  # the cell was run again, the newer run displays its own outputs
+
         self.run_label.running = False
         self.exec_count = execution_count
+        self._received_outputs = None
         self.outputs = outputs
         self.call_next(self.update_outputs, outputs)  # update the output cells
 
+    def outputs_received(self, outputs: list[dict[str, Any]], generation: int) -> None:
+        """Display the outputs received so far while the cell is running. Outputs that arrive
+        before the queued update runs are displayed by that same update.
+
+        Args:
+            outputs: snapshot of the serialized outputs received so far.
+            generation: the run the outputs belong to.
+        """
+        if generation != self._run_generation:
+            return  # queued before the cell was run again
+        self._received_outputs = outputs
+        if not self._outputs_pending:
+            self._outputs_pending = True
+            self.call_next(self._update_received_outputs)
+
+    async def _update_received_outputs(self) -> None:
+        """Update the output widgets with the outputs received so far."""
+        self._outputs_pending = False
+        if self._received_outputs is not None:  # None once the run finished or was restarted
+            await self.update_outputs(self._received_outputs)
+
     def interrupt_cell(self) -> None:
         """Interrupt kernel when running cell."""
         if not self.notebook.notebook_kernel.initialized:
@@ -1,12 +1,43 @@
 from textual.app import ComposeResult
-from textual.widgets import Markdown, Static, ContentSwitcher
+from textual.widgets import Markdown, ContentSwitcher
 from textual.events import Key, MouseDown
 from textual.containers import HorizontalGroup
 
+from markdown_it import MarkdownIt
+from markdown_it.token import Token
+from functools import lru_cache
 from typing import Any
 
 from .cell import Cell, SplitTextArea
 
+MARKDOWN_CACHE_SIZE = 256  # number of parsed markdown sources shared across cells
+
+
+@lru_cache(maxsize=MARKDOWN_CACHE_SIZE)
+def parse_markdown(source: str) -> list[Token]:
+    """Parse markdown source into tokens. Cached so that cells with the same source (reopened
+    notebooks, copied cells) only get parsed once.
+
+    Args:
+        source: the markdown source.
+
+    Returns: list of markdown-it tokens for the source.
+    """
+    return MarkdownIt("gfm-like").parse(source)
+
+
+class CachedMarkdownIt(MarkdownIt):
+    """Markdown parser that reuses the tokens from `parse_markdown`."""
+
+    def parse(self, src: str, env=None) -> list[Token]:
+        if env is not None:
+            return super().parse(src, env)
+        return parse_markdown(src)
+
+
+# the `Markdown` widgets only read the tokens so a single parser can be shared
+_markdown_parser = CachedMarkdownIt("gfm-like")
+
 
 class MarkdownCell(Cell):
     """Widget to contain markdown cells in a notebook"""
@@ -17,19 +48,21 @@ class MarkdownCell(Cell):
         self,
         notebook,
         source: str = "",
-        metadata: dict[str, Any] = {},
+        metadata: dict[str, Any] | None = None,
         cell_id: str | None = None,
+        id: str | None = None,
     ) -> None:
-        super().__init__(notebook, source, "markdown", metadata, cell_id)
+        super().__init__(notebook, source, "markdown", metadata, cell_id, id)
         self.collapse_btn.styles.width = 5
         self.switcher = ContentSwitcher(id="collapse-content", initial="markdown")
-        self.collapsed_markdown = Static(
-            "Collapsed Markdown...", id="collapsed-display"
-        )
+        # the input text is only mounted when the cell is first opened for editing
         self.input_text = SplitTextArea.code_editor(
             self.source, id="text", language="markdown", show_line_numbers=False
         )
-        self.markdown = Markdown(self.source, id="markdown")
+        self.markdown = Markdown(
+            self.source, id="markdown", parser_factory=lambda: _markdown_parser
+        )
+        self._last_rendered_source = self.source  # source the markdown was last rendered with
 
     def compose(self) -> ComposeResult:
         """Compose with:
@@ -37,17 +70,22 @@ class MarkdownCell(Cell):
             - HorziontalGroup
                 - CollapseLabela (id=collapse-button)
                 - ContentSwitcher (id=collapse-content)
-                    - SplitTextArea (id=text)
-                    - FocusMarkdown (id=markdown)
                     - Static (id=collapsed-display)
+                    - Markdown (id=markdown)
+                    - SplitTextArea (id=text, mounted when the cell is first opened)
         """
         with HorizontalGroup():
             yield self.collapse_btn
             with self.switcher:
                 yield self.collapsed_display
-                yield self.input_text
                 yield self.markdown
 
+    async def mount_input_text(self) -> None:
+        """Mount the input text in the content switcher if it has not been mounted yet. Cells
+        that are only read never create the editor's widgets."""
+        if not self.input_text.is_mounted:
+            await self.switcher.mount(self.input_text)
+
     def on_double_click(self, event: MouseDown) -> None:
         """Double click event handler that switches content to the input text from markdown.
 
@@ -55,8 +93,7 @@ class MarkdownCell(Cell):
             event: MouseDown event.
         """
         if self.switcher.current == "markdown":
-            self.switcher.current = "text"
-            self.input_text.focus()
+            self.call_next(self.open)
 
     def action_collapse(self) -> None:
         """Toggle the collapsed."""
@@ -75,17 +112,21 @@ class MarkdownCell(Cell):
         # if not self.source:
         #     self.markdown.update(PLACEHOLDER)
         # else:
-        self.markdown.update(self.source)
+        # only re-parse the markdown if the source changed since it was last rendered
+        if self.source != self._last_rendered_source:
+            self.markdown.update(self.source)
+            self._last_rendered_source = self.source
         self.switcher.current = "markdown"
 
     @staticmethod
-    def from_nb(nb: dict[str, Any], notebook) -> "MarkdownCell":
+    def from_nb(nb: dict[str, Any], notebook, id: str | None = None) -> "MarkdownCell":
         """Static method to generate a `MarkdownCell` from a json/dict that represent a
         makrdown cell.
 
         Args:
             nb: the notebook json/dict format of the markdown cell.
             notebook: the `Notebook` object the markdown cell belongs too.
+            id: the widget id to use. A new one is generated if None.
 
         Returns: `MarkdownCell` from notebook format.
 
@@ -109,6 +150,7 @@ class MarkdownCell(Cell):
             source=source,
             metadata=nb["metadata"],
             cell_id=nb.get("id"),
+            id=id,
         )
 
     def to_nb(self) -> dict[str, Any]:
@@ -125,7 +167,7 @@ class MarkdownCell(Cell):
             "cell_type": "markdown",
             "metadata": self._metadata,
             "source": self.input_text.text,
-            "id": self._cell_id,
+            "id": self.cell_id,
         }
 
     def create_cell(self, source) -> "MarkdownCell":
@@ -145,6 +187,7 @@ class MarkdownCell(Cell):
             source=self.input_text.text,
             metadata=self._metadata,
             cell_id=self._cell_id,
+            id=self.id,
         )
         if connect:
             clone.next = self.next
@@ -153,5 +196,6 @@ class MarkdownCell(Cell):
 
     async def open(self):
         """Defines what it means to open a markdown cell. Focus on the input_text widget."""
+        await self.mount_input_text()
         self.switcher.current = "text"
         self.call_after_refresh(self.input_text.focus)
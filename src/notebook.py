@@ -1,20 +1,60 @@
 from textual.app import ComposeResult
-from textual.widgets import TextArea, Markdown
+from textual.widgets import TextArea
 from textual.containers import VerticalScroll, Container, HorizontalScroll
 from textual.events import Key, DescendantFocus, Click
 from textual.binding import Binding
 
 from typing import Any
+from functools import lru_cache
+import asyncio
 import json
 from pathlib import Path
 
 from .markdown_cell import MarkdownCell
-from .code_cell import CodeCell, CodeArea, OutputText, OutputJson, OutputAnsi
+from .code_cell import CodeCell, OutputText, OutputJson, OutputAnsi
 from .cell import CopyTextArea, Cell, StaticBtn
 from .notebook_kernel import NotebookKernel
 
 
 MAX_UNDO_LEN = 20
+# number of parents between a focused widget and the cell it belongs to. subclasses use the depth
+# of their closest listed base class
+CELL_DEPTH_BY_TYPE: dict[type, int] = {
+    Cell: 0,
+    CopyTextArea: 3,  # the cell input text areas
+    OutputText: 6,  # inside the content switcher of an `OutputJson` or `OutputAnsi`
+    OutputJson: 4,
+    OutputAnsi: 4,
+}
+
+
+@lru_cache
+def get_cell_depth(widget_type: type) -> int | None:
+    """Get the number of parents between a focused widget and its cell from `CELL_DEPTH_BY_TYPE`
+    using the closest base class of the widget's type that is listed.
+
+    Args:
+        widget_type: the type of the focused widget.
+
+    Returns: the number of parents, None if the widget is not part of a cell.
+    """
+    for base in widget_type.__mro__:
+        if (depth := CELL_DEPTH_BY_TYPE.get(base)) is not None:
+            return depth
+    return None
+
+
+def read_notebook(path: Path) -> dict[str, Any]:
+    """Read and parse a notebook file. Called in an executor so large notebooks don't block the
+    event loop.
+
+    Args:
+        path: path to the notebook file.
+
+    Returns: the notebook json/dict format.
+    """
+    with open(path, "r") as notebook_file:
+        return json.load(notebook_file)
 
 
 class ButtonRow(HorizontalScroll):
@@ -47,8 +87,7 @@ class Notebook(Container):
 
     last_focused: Cell | None = None  # keep track of the last focused cell
     last_copied: Cell | None = None  # keep track of the copied/cut cell
-    _delete_stack: list[tuple[dict[str, Any], str, str]] = []
-    _merge_list: list[Cell] = []  # list of the cells to be merged.
+    _delete_stack: list[tuple[dict[str, Any], str, str | None, str]] = []
 
     BINDINGS = [
         Binding("a", "add_cell_after", "Add Cell After", False),
@@ -66,12 +105,17 @@ class Notebook(Container):
         ("ctrl+w", "save_as", "Save As"),
     ]
 
-    def __init__(self, path: str, id: str, term_app) -> None:
+    def __init__(
+        self, path: str, id: str, term_app, focus_on_mount: bool = True
+    ) -> None:
         super().__init__(id=id)
 
         self.path = path
         self.notebook_kernel = NotebookKernel()
         self.term_app = term_app
+        self._focus_on_mount = focus_on_mount  # whether to take focus when mounted
+        # cells to be merged in the order they were selected. a dict for O(1) deselecting
+        self._merge_list: dict[Cell, None] = {}
 
         self._metadata: dict[str, Any] | None = None
         self._nbformat: int = 4
@@ -98,7 +142,8 @@ class Notebook(Container):
                 with open(self.path, "w") as f:
                     pass
 
-        self.call_after_refresh(self.focus_notebook)
+        if self._focus_on_mount:
+            self.call_after_refresh(self.focus_notebook)
 
         if not self.notebook_kernel.initialized:
             self.notify(
@@ -120,19 +165,12 @@ class Notebook(Container):
         Args:
             event: descendant focus event.
         """
+        if (depth := get_cell_depth(type(event.widget))) is not None:
+            cell = event.widget
+            for _ in range(depth):
+                cell = cell.parent
+            self.last_focused = cell
         # Ignore buttons
-        if isinstance(event.widget, CodeCell) or isinstance(event.widget, MarkdownCell):
-            self.last_focused = event.widget
-        elif any(
-            isinstance(event.widget, widgetType)
-            for widgetType in [OutputJson, OutputText, OutputAnsi]
-        ) or event.widget.id in ["pretty-error-output", "plain-error-output"]:
-            self.last_focused = event.widget.parent.parent.parent.parent
-        elif any(
-            isinstance(event.widget, widgetType)
-            for widgetType in [Markdown, CopyTextArea, CodeArea]
-        ):
-            self.last_focused = event.widget.parent.parent.parent
         elif self.last_focused:
             self.last_focused.focus()
 
@@ -152,7 +190,7 @@ class Notebook(Container):
             case "escape":
                 for cell in self._merge_list:
                     cell.merge_select = False
-                self._merge_list = []
+                self._merge_list.clear()
             case "up" if not isinstance(self.app.focused, TextArea):
                 if self.last_focused and (prev_cell := self.last_focused.prev):
                     prev_cell.focus()
@@ -343,10 +381,10 @@ class Notebook(Container):
         """
         if len(self._merge_list) < 2:
             return
-        target: CodeCell | MarkdownCell = self._merge_list[0]
-        target.merge_cells_with_self(self._merge_list[1:])
+        target, *cells = self._merge_list
+        target.merge_cells_with_self(cells)
         target.merge_select = False
-        self._merge_list = []
+        self._merge_list.clear()
 
     async def action_toggle_cell(self) -> None:
         """Callback for binding to swtich the cell type keeping the input text source."""
@@ -360,27 +398,30 @@ class Notebook(Container):
         """Undo last deletion by recreating cell from saved serialized data. Try to find the `Cell`
         with the id stored and mount relative to it with the stored position. If the query by id
         fails, just place relative to the `last_focused` cell. If the stored id is
-        None, then widget was the only cell in the notebook when it was deleted.
+        None, then widget was the only cell in the notebook when it was deleted. The recreated cell
+        gets the widget id of the deleted one so the cells deleted before it can still be placed
+        relative to it.
         """
         if len(self._delete_stack) == 0:
             return
 
         # get the last deleted cell
-        last_delete, position, relative_to_id = self._delete_stack.pop()
+        last_delete, position, relative_to_id, widget_id = self._delete_stack.pop()
+        if self.cell_container.query_children(f"#{widget_id}"):
+            # the deleted cell has not been removed yet
+            widget_id = None
 
         # recreate the deleted cell
         match last_delete["cell_type"]:
             case "markdown":
-                widget = MarkdownCell.from_nb(last_delete, self)
+                widget = MarkdownCell.from_nb(last_delete, self, widget_id)
             case "code":
-                widget = CodeCell.from_nb(last_delete, self)
+                widget = CodeCell.from_nb(last_delete, self, widget_id)
 
         if relative_to_id:
             try:
                 # attempt to find the cell to mount relative to
-                target_widget = self.cell_container.query_one(
-                    f"#{relative_to_id}", Cell
-                )
+                target_widget = self.cell_container.get_child_by_id(relative_to_id, Cell)
             except:
                 # if the query fails, the target position should be relative to the last_focused cell
                 target_widget = self.last_focused
@@ -408,7 +449,9 @@ class Notebook(Container):
         if remember:
             # add it to the `delete_stack` for undoing
             id = next_focus.id if next_focus else None
-            self._delete_stack.append((self.last_focused.to_nb(), position, id))
+            self._delete_stack.append(
+                (self.last_focused.to_nb(), position, id, self.last_focused.id)
+            )
             if len(self._delete_stack) > MAX_UNDO_LEN:
                 self._delete_stack = self._delete_stack[-MAX_UNDO_LEN:]
 
@@ -489,26 +532,29 @@ class Notebook(Container):
         with open(path, "w") as nb_file:
             json.dump(nb, nb_file)
 
-    def load_notebook(self) -> None:
-        """Load notebook from a file. Iterate through the cells and generate the `CodeCell` and
-        `MarkdownCell` objects from the serialized formats and mount them to the `cell_container`.
+    async def load_notebook(self) -> None:
+        """Load notebook from a file. The file is read and parsed in an executor, then iterate
+        through the cells and generate the `CodeCell` and `MarkdownCell` objects from the
+        serialized formats, link them and mount them to the `cell_container`.
         """
-        with open(self.path, "r") as notebook_file:
-            content = json.load(notebook_file)
-            for idx, cell in enumerate(content["cells"]):
-                if cell["cell_type"] == "code":
-                    widget = CodeCell.from_nb(cell, self)
-                elif cell["cell_type"] == "markdown":
-                    widget = MarkdownCell.from_nb(cell, self)
-
-                if idx != 0:
-                    prev.next = widget
-                    widget.prev = prev
-                else:
-                    self.last_focused = widget
-
-                prev = widget
-                self.call_next(self.cell_container.mount, widget)
+        content = await asyncio.get_running_loop().run_in_executor(
+            None, read_notebook, self.path
+        )
+        cells: list[Cell] = []
+        for cell in content["cells"]:
+            if cell["cell_type"] == "code":
+                cells.append(CodeCell.from_nb(cell, self))
+            elif cell["cell_type"] == "markdown":
+                cells.append(MarkdownCell.from_nb(cell, self))
+
+        # link all the cells in one pass then mount them together
+        for prev, widget in zip(cells, cells[1:]):
+            prev.next = widget
+            widget.prev = prev
+
+        if cells:
+            self.last_focused = cells[0]
+        await self.cell_container.mount_all(cells)
 
     async def add_cell(
         self,
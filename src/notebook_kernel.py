@@ -1,7 +1,27 @@
-from typing import Any
+from typing import Any, Callable
 from jupyter_client import KernelManager, BlockingKernelClient
 from threading import Lock
 
+OUTPUT_MSG_TYPES = {"display_data", "stream", "error", "execute_result"}  # messages with outputs
+
+
+def snapshot_outputs(outputs: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Copy the outputs received so far so they can be read by another thread while the kernel
+    thread keeps appending to them and merging stream chunks into the last one.
+
+    Args:
+        outputs: the outputs received so far.
+
+    Returns: copies of the output dicts, with the stream chunk lists copied as well.
+    """
+    snapshot = []
+    for output in outputs:
+        output = dict(output)
+        if isinstance(output.get("text"), list):
+            output["text"] = list(output["text"])
+        snapshot.append(output)
+    return snapshot
+
 
 class NotebookKernel:
     """Class for kernel for each notebook. Contains kernel manager and client used to
@@ -71,16 +91,22 @@ class NotebookKernel:
         finally:
             return language_info
 
-    def run_code(self, code: str) -> list[dict[str, Any]]:
+    def run_code(
+        self,
+        code: str,
+        on_output: Callable[[list[dict[str, Any]]], None] | None = None,
+    ) -> list[dict[str, Any]]:
         """Run provided code string with the kernel. Uses the iopub channel to get results.
 
         Args:
             code: code string.
+            on_output: called from the executing thread with a snapshot of the outputs received
+                so far each time a new output arrives.
 
         Returns: the outputs of executing the code with the kernel.
         """
         with self.execution_lock:  # acquire lock for executing code
-            self.kernel_client.execute(code)
+            msg_id = self.kernel_client.execute(code)
 
             # Read the output from the iopub channel
             outputs = []
@@ -88,6 +114,9 @@ class NotebookKernel:
             while True:
                 try:
                     msg = self.kernel_client.get_iopub_msg()
+                    if msg["parent_header"].get("msg_id") != msg_id:
+                        continue  # left over from an earlier request (e.g. kernel info)
+
                     match msg["header"]["msg_type"]:
                         case "execute_input":
                             # if no execute output is present for execution, execution count can
@@ -130,7 +159,19 @@ class NotebookKernel:
                             # }
                             output = msg["content"]
                             output["output_type"] = "stream"
-                            outputs.append(output)
+                            last = outputs[-1] if outputs else None
+                            if (
+                                last is not None
+                                and last["output_type"] == "stream"
+                                and last["name"] == output["name"]
+                            ):
+                                # consecutive chunks of the same stream are kept in one output,
+                                # the chunks are collected in a list and joined once at the end
+                                if isinstance(last["text"], str):
+                                    last["text"] = [last["text"]]
+                                last["text"].append(output["text"])
+                            else:
+                                outputs.append(output)
                         case "error":
                             # {
                             #   'ename' : str,   # Exception name, as a string
@@ -165,8 +206,15 @@ class NotebookKernel:
                         case "status":
                             if msg["content"]["execution_state"] == "idle":
                                 break
+
+                    if on_output is not None and msg["header"]["msg_type"] in OUTPUT_MSG_TYPES:
+                        on_output(snapshot_outputs(outputs))
                 except Exception as e:
                     pass
+
+            for output in outputs:
+                if output["output_type"] == "stream" and isinstance(output["text"], list):
+                    output["text"] = "".join(output["text"])
             return outputs, execution_count
 
     def interrupt_kernel(self) -> None:
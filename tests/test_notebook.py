@@ -0,0 +1,125 @@
+import asyncio
+import json
+from typing import Callable
+
+from src.app import Erys
+from src.cell import Cell
+
+WAIT_TIMEOUT = 10  # seconds to wait for the app to reach an expected state
+
+
+def write_notebook(path, sources: list[str]) -> None:
+    """Write a notebook with a markdown cell for each source."""
+    notebook = {
+        "cells": [
+            {"cell_type": "markdown", "id": source, "metadata": {}, "source": source}
+            for source in sources
+        ],
+        "metadata": {},
+        "nbformat": 4,
+        "nbformat_minor": 5,
+    }
+    path.write_text(json.dumps(notebook))
+
+
+async def wait_for(pilot, condition: Callable[[], bool]) -> None:
+    """Process messages until `condition` holds.
+
+    Args:
+        pilot: the pilot of the running app.
+        condition: the state to wait for.
+
+    Raises:
+        TimeoutError: if the condition does not hold within `WAIT_TIMEOUT` seconds.
+    """
+    deadline = asyncio.get_running_loop().time() + WAIT_TIMEOUT
+    while not condition():
+        if asyncio.get_running_loop().time() > deadline:
+            raise TimeoutError("the app did not reach the expected state")
+        await pilot.pause()
+
+
+def cell_sources(notebook) -> list[str]:
+    """The sources of the cells mounted in the notebook, in order."""
+    return [cell.to_nb()["source"] for cell in notebook.cell_container.query_children(Cell)]
+
+
+def run_notebook(path, actions: Callable) -> list[str]:
+    """Open the notebook at `path`, run `actions` on it and return the resulting cell sources.
+
+    Args:
+        path: path of the notebook to open.
+        actions: coroutine function called with the pilot and the notebook.
+
+    Returns: the sources of the cells after the actions.
+    """
+
+    async def run() -> list[str]:
+        app = Erys([str(path)])
+        async with app.run_test() as pilot:
+            await wait_for(
+                pilot,
+                lambda: app.current_notebook is not None
+                and len(app.current_notebook.cell_container.query_children(Cell)) > 0,
+            )
+            await actions(pilot, app.current_notebook)
+            return cell_sources(app.current_notebook)
+
+    return asyncio.run(run())
+
+
+async def delete_first(pilot, notebook) -> None:
+    """Delete the first cell and wait until it is removed."""
+    count = len(notebook.cell_container.query_children(Cell))
+    notebook.last_focused = notebook.cell_container.query_children(Cell).first()
+    notebook.delete_cell()
+    await wait_for(
+        pilot, lambda: len(notebook.cell_container.query_children(Cell)) == count - 1
+    )
+
+
+async def undo(pilot, notebook) -> None:
+    """Undo the last delete and wait until the cell is mounted."""
+    count = len(notebook.cell_container.query_children(Cell))
+    notebook.undo_delete()
+    await wait_for(
+        pilot, lambda: len(notebook.cell_container.query_children(Cell)) == count + 1
+    )
+
+
+def test_undo_delete_after_move(tmp_path):
+    """The deleted cell is restored before its old neighbour even after that neighbour was moved."""
+    path = tmp_path / "cells.ipynb"
+    write_notebook(path, ["a", "b", "c", "d"])
+
+    async def actions(pilot, notebook) -> None:
+        await delete_first(pilot, notebook)
+
+        # move b down
+        notebook.last_focused = notebook.cell_container.query_children(Cell).first()
+        await notebook.action_move_down()
+        await wait_for(pilot, lambda: cell_sources(notebook) == ["c", "b", "d"])
+
+        # focus away from b so undo cannot fall back to the focused cell
+        notebook.last_focused = notebook.cell_container.query_children(Cell).last()
+        await undo(pilot, notebook)
+
+    assert run_notebook(path, actions) == ["c", "a", "b", "d"]
+
+
+def test_undo_delete_twice(tmp_path):
+    """A restored cell can be used to place the cell that was deleted before it."""
+    path = tmp_path / "cells.ipynb"
+    write_notebook(path, ["a", "b", "c", "d"])
+
+    async def actions(pilot, notebook) -> None:
+        await delete_first(pilot, notebook)
+        await delete_first(pilot, notebook)
+
+        # focus away from c so undo cannot fall back to the focused cell
+        notebook.last_focused = notebook.cell_container.query_children(Cell).last()
+        await undo(pilot, notebook)
+        notebook.last_focused = notebook.cell_container.query_children(Cell).last()
+        await undo(pilot, notebook)
+
+    assert run_notebook(path, actions) == ["a", "b", "c", "d"]